@@ -4,59 +4,124 @@ CoinGecko API Data Validation and Logging Tool
 Features:
 - CLI argument support for coins and currency
 - Retry logic for API calls
-- Validation using jsonschema
+- Optional strict validation using fastjsonschema
 - Logs and reports in PST
 - Type hints and improved error handling
 - Configuration management
 - Enhanced logging
 """
 
-import json
 import logging
 import os
+import sys
 import argparse
-import pytz
+import random
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from time import sleep
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple,
+    Union
+)
+from dataclasses import dataclass, replace
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
-import requests
-from jsonschema import validate, ValidationError
-import yaml
+import orjson
+
+# Heavy third-party modules are imported where they are used to keep CLI startup fast
+if TYPE_CHECKING:
+    import requests
+    from requests_cache import CachedSession
 
 # Setup PST timezone
-PST = pytz.timezone('US/Pacific')
+PST = ZoneInfo('US/Pacific')
+
+# Timestamp format used in report filenames
+_STRFTIME_FMT = '%Y%m%d_%H%M%S'
+
+# Exact JSON number types; bool (an int subclass) is deliberately excluded
+_NUMERIC = (int, float)
+
+# Sentinel marking a coin absent from the response; present values such as
+# None are reported separately as invalid data
+_MISSING = object()
+
+# Connections kept per host by each thread's session
+_POOL_MAXSIZE = 8
+
+# Maximum number of currencies fetched concurrently
+_MAX_FETCH_WORKERS = 8
+
+# Per-thread HTTP sessions, keyed by cache name (see _get_session)
+_THREAD_LOCAL = threading.local()
+
+# Upper bound (seconds) for the exponential retry backoff, before jitter
+_MAX_BACKOFF = 30
+
+
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 # Configuration dataclass
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Config:
-    """Configuration settings for the application."""
+    """Configuration settings for the application (immutable and hashable)."""
     base_url: str = "https://api.coingecko.com/api/v3/simple/price"
-    default_coins: List[str] = None
+    default_coins: Tuple[str, ...] = ("bitcoin", "ethereum")
     default_currency: str = "usd"
     max_retries: int = 3
     retry_delay: int = 2
     request_timeout: int = 10
     log_level: str = "INFO"
     logs_dir: str = "logs"
+    cache_name: str = ".coingecko_cache"
+    cache_expire_after: int = 45
 
     def __post_init__(self):
-        if self.default_coins is None:
-            self.default_coins = ["bitcoin", "ethereum"]
+        # An empty config key yields None; fall back to the default coins
+        default_coins = self.default_coins
+        if default_coins is None:
+            default_coins = ("bitcoin", "ethereum")
+        # Config files provide lists; store a tuple to keep the instance hashable
+        object.__setattr__(self, 'default_coins', tuple(default_coins))
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime: float) -> Config:
+    """
+    Parse a configuration file into a Config.
+
+    JSON-compatible files are parsed with orjson, anything else falls back
+    to YAML. Results are cached per (path, mtime), so the returned Config is
+    shared between callers and must not be mutated.
+    """
+    with open(config_path, 'rb') as file:
+        raw = file.read()
+    try:
+        config_data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        config_data = yaml.load(raw, Loader=loader)
+    return Config(**config_data)
 
 
 def load_config(config_path: str = "config.yaml") -> Config:
-    """Load configuration from YAML file or use defaults."""
+    """Load configuration from YAML or JSON file or use defaults."""
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as file:
-                config_data = yaml.safe_load(file)
-                return Config(**config_data)
+            return _read_config(config_path, os.path.getmtime(config_path))
         except Exception as e:
-            logging.warning(f"Failed to load config from {config_path}: {e}. Using defaults.")
+            logging.warning(
+                "Failed to load config from %s: %s. Using defaults.", config_path, e
+            )
     return Config()
 
 
@@ -89,19 +154,23 @@ def setup_logging(config: Config) -> None:
     logger.addHandler(console_handler)
 
 
-def generate_schema(coins_list: List[str], currency: str) -> Dict[str, Any]:
+@lru_cache(maxsize=64)
+def generate_schema(coins_tuple: Tuple[str, ...], currency: str) -> Dict[str, Any]:
     """
     Dynamically generate a JSON schema based on the coins requested.
 
+    Results are cached per (coins_tuple, currency), so the returned
+    dictionary is shared between callers and must not be mutated.
+
     Args:
-        coins_list: List of coin IDs to validate
+        coins_tuple: Tuple of coin IDs to validate
         currency: Currency code for validation
 
     Returns:
         JSON schema dictionary
     """
     properties = {}
-    for coin in coins_list:
+    for coin in coins_tuple:
         properties[coin] = {
             'type': 'object',
             'properties': {
@@ -114,11 +183,24 @@ def generate_schema(coins_list: List[str], currency: str) -> Dict[str, Any]:
     schema = {
         'type': 'object',
         'properties': properties,
-        'required': coins_list
+        'required': list(coins_tuple)
     }
     return schema
 
 
+@lru_cache(maxsize=128)
+def _get_validator(coins_key: Tuple[str, ...], currency: str) -> Callable[[Any], Any]:
+    """
+    Compile and cache a schema validator for a coin set and currency.
+
+    fastjsonschema generates a Python function specialised to the schema,
+    which is reused for every subsequent call with the same arguments.
+    """
+    import fastjsonschema
+
+    return fastjsonschema.compile(generate_schema(coins_key, currency))
+
+
 class APIError(Exception):
     """Custom exception for API-related errors."""
     pass
@@ -129,6 +211,55 @@ class ValidationError(Exception):
     pass
 
 
+def _get_session(cache_name: str) -> "CachedSession":
+    """
+    Return this thread's HTTP session for a response cache file.
+
+    Responses are cached in SQLite so repeated runs within the API's
+    refresh window skip the network, and the mounted adapter keeps
+    pooled keep-alive connections for the requests that do go out.
+    requests does not guarantee Session is thread-safe, so each thread
+    gets its own session; they share only the SQLite cache file.
+    """
+    sessions = getattr(_THREAD_LOCAL, 'sessions', None)
+    if sessions is None:
+        sessions = _THREAD_LOCAL.sessions = {}
+    if cache_name in sessions:
+        return sessions[cache_name]
+
+    from requests.adapters import HTTPAdapter
+    from requests_cache import CachedSession
+
+    session = CachedSession(
+        cache_name=cache_name,
+        backend='sqlite',
+        allowable_methods=('GET',)
+    )
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE))
+    sessions[cache_name] = session
+    return session
+
+
+def _retry_delay(
+        attempt: int,
+        config: Config,
+        response: Optional["requests.Response"]
+) -> float:
+    """
+    Compute how long to wait before retrying a failed request.
+
+    Honors an integer Retry-After header on HTTP 429, otherwise uses
+    exponential backoff plus up to a second of jitter. Both waits are
+    capped at _MAX_BACKOFF seconds.
+    """
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(int(retry_after), _MAX_BACKOFF)
+    return min(config.retry_delay * 2 ** (attempt - 1), _MAX_BACKOFF) + random.random()
+
+
 def fetch_crypto_data(
         coins: str,
         currency: str,
@@ -148,6 +279,8 @@ def fetch_crypto_data(
     Raises:
         APIError: If all retry attempts fail
     """
+    import requests
+
     params = {
         'ids': coins,
         'vs_currencies': currency,
@@ -155,41 +288,108 @@ def fetch_crypto_data(
     }
 
     logger = logging.getLogger(__name__)
+    session = _get_session(config.cache_name)
+    # expire_after=0 alone would still serve existing entries, so turn the cache off
+    use_cache = config.cache_expire_after > 0
+    request_kwargs = {'expire_after': config.cache_expire_after} if use_cache else {}
 
     for attempt in range(1, config.max_retries + 1):
         try:
-            logger.info(f"Fetching data (attempt {attempt}/{config.max_retries})")
-            response = requests.get(
-                config.base_url,
-                params=params,
-                timeout=config.request_timeout
-            )
+            logger.info("Fetching data (attempt %s/%s)", attempt, config.max_retries)
+            with nullcontext() if use_cache else session.cache_disabled():
+                response = session.get(
+                    config.base_url,
+                    params=params,
+                    timeout=config.request_timeout,
+                    **request_kwargs
+                )
             response.raise_for_status()
 
-            data = response.json()
-            logger.info(f"Data fetched successfully: {len(data)} coins")
+            data = orjson.loads(response.content)
+            logger.info("Data fetched successfully: %s coins", len(data))
             return data
 
         except requests.exceptions.RequestException as e:
-            logger.warning(f"Attempt {attempt} failed: {e}")
+            logger.warning("Attempt %s failed: %s", attempt, e)
             if attempt < config.max_retries:
-                logger.info(f"Retrying in {config.retry_delay} seconds...")
-                sleep(config.retry_delay)
+                delay = _retry_delay(attempt, config, e.response)
+                logger.info("Retrying in %.1f seconds...", delay)
+                sleep(delay)
             else:
-                error_msg = f"All {config.max_retries} retry attempts failed"
+                error_msg = (
+                    f"All {config.max_retries} retry attempts failed for {currency}"
+                )
                 logger.error(error_msg)
                 raise APIError(error_msg) from e
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            raise APIError(f"Invalid JSON response: {e}") from e
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            raise APIError(f"Invalid JSON response for {currency}: {e}") from e
 
     return None
 
 
+def fetch_crypto_data_many(
+        coins: str,
+        currencies: Iterable[str],
+        config: Config
+) -> Dict[str, Union[Optional[Dict[str, Any]], APIError]]:
+    """
+    Fetch crypto data for several currencies concurrently.
+
+    Requests run on a thread pool, each worker with its own session over the
+    shared response cache, so total wall time approaches the slowest single
+    request. A single currency is fetched directly on the calling thread.
+    A currency that fails does not affect the others: its APIError is
+    returned in place of its data.
+
+    Args:
+        coins: Comma-separated string of coin IDs
+        currencies: Currency codes to fetch prices in
+        config: Configuration object
+
+    Returns:
+        Mapping of currency code to JSON response data, or to the APIError
+        raised while fetching that currency
+    """
+    def fetch(currency: str) -> Union[Optional[Dict[str, Any]], APIError]:
+        try:
+            return fetch_crypto_data(coins, currency, config)
+        except APIError as e:
+            return e
+
+    unique_currencies = list(dict.fromkeys(currencies))
+    if len(unique_currencies) <= 1:
+        return {currency: fetch(currency) for currency in unique_currencies}
+
+    workers = min(len(unique_currencies), _MAX_FETCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch, unique_currencies)
+        return dict(zip(unique_currencies, results))
+
+
+# Report detail lines, rendered from (code, coin, value) events at output time
+EVENT_TEMPLATES = {
+    'no_data': 'No data received from API.',
+    'schema_pass': 'Schema validation passed.',
+    'schema_error': 'Schema validation error: {value}',
+    'missing': 'Missing data for {coin}',
+    'invalid_data': 'Invalid data for {coin}: {value}',
+    'invalid_payload': 'Invalid response payload, expected an object: {value}',
+    'invalid_price': 'Invalid or missing price for {coin}: {value}',
+    'invalid_change': 'Invalid 24h % change for {coin}: {value}',
+    'valid': '✓ {coin}: {value:.2f} {currency}',
+    'valid_change': '✓ {coin}: {value[0]:.2f} {currency} (24h change: {value[1]:+.2f}%)',
+    'all_valid': '✓ All {value} coins validated successfully.',
+    'partial': '✗ Only {value[0]}/{value[1]} coins validated successfully.',
+}
+
+
 def validate_crypto_data(
         data: Optional[Dict[str, Any]],
         coins_list: List[str],
-        currency: str
+        currency: str,
+        strict: bool = False,
+        now: Optional[datetime] = None
 ) -> Dict[str, Any]:
     """
     Validate fetched crypto data and include prices with 24h change in report.
@@ -198,15 +398,20 @@ def validate_crypto_data(
         data: API response data
         coins_list: List of expected coin IDs
         currency: Currency code for validation
+        strict: Also validate the payload against the generated JSON schema
+        now: Run timestamp in PST (defaults to the current time)
 
     Returns:
-        Validation report dictionary
+        Validation report dictionary. Details are recorded as
+        (code, coin, value) tuples under 'events' and rendered into
+        human-readable lines by save_report(), stream_report() and
+        print_summary(), or explicitly with render_report().
     """
-    now_pst = datetime.now(PST).isoformat()
+    now_pst = (now or datetime.now(PST)).isoformat()
     report = {
         'timestamp': now_pst,
         'status': 'PASS',
-        'details': [],
+        'events': [],
         'coins_requested': coins_list,
         'currency': currency,
         'summary': {}
@@ -216,49 +421,66 @@ def validate_crypto_data(
 
     if not data:
         report['status'] = 'FAIL'
-        report['details'].append('No data received from API.')
+        report['events'].append(('no_data', None, None))
         logger.error("Validation failed: No data received")
         return report
 
-    # Schema validation
-    try:
-        schema = generate_schema(coins_list, currency)
-        validate(instance=data, schema=schema)
-        report['details'].append('Schema validation passed.')
-        logger.info("Schema validation passed")
-    except ValidationError as e:
+    # Schema validation (strict mode only; the checks below cover the same shape)
+    if strict:
+        from fastjsonschema import JsonSchemaValueException
+
+        try:
+            # JSON Schema requires unique entries in 'required'
+            _get_validator(tuple(dict.fromkeys(coins_list)), currency)(data)
+            report['events'].append(('schema_pass', None, None))
+            logger.info("Schema validation passed")
+        except JsonSchemaValueException as e:
+            report['status'] = 'FAIL'
+            report['events'].append(('schema_error', None, e.message))
+            logger.error("Schema validation failed: %s", e.message)
+
+    if type(data) is not dict:
         report['status'] = 'FAIL'
-        report['details'].append(f'Schema validation error: {e.message}')
-        logger.error(f"Schema validation failed: {e.message}")
+        report['events'].append(('invalid_payload', None, data))
+        logger.error("Validation failed: response is not an object: %s", data)
+        return report
 
     # Data validation
     valid_coins = 0
     total_coins = len(coins_list)
+    # Every coin records exactly one event, so the list can be sized up front
+    coin_events: List[Any] = [None] * total_coins
+    pct_change_key = f"{currency}_24h_change"
 
-    for coin in coins_list:
-        if coin not in data:
+    for index, coin in enumerate(coins_list):
+        coin_data = data.get(coin, _MISSING)
+        if coin_data is _MISSING:
             report['status'] = 'FAIL'
-            report['details'].append(f'Missing data for {coin}')
-            logger.warning(f"Missing data for {coin}")
+            coin_events[index] = ('missing', coin, None)
+            logger.warning("Missing data for %s", coin)
+            continue
+
+        if type(coin_data) is not dict:
+            report['status'] = 'FAIL'
+            coin_events[index] = ('invalid_data', coin, coin_data)
+            logger.error("Invalid data for %s: %s", coin, coin_data)
             continue
 
-        coin_data = data[coin]
         price = coin_data.get(currency)
-        pct_change_key = f"{currency}_24h_change"
         pct_change = coin_data.get(pct_change_key)
 
         # Validate price
-        if price is None or not isinstance(price, (int, float)) or price <= 0:
+        if not (type(price) in _NUMERIC and price > 0):
             report['status'] = 'FAIL'
-            report['details'].append(f'Invalid or missing price for {coin}: {price}')
-            logger.error(f"Invalid price for {coin}: {price}")
+            coin_events[index] = ('invalid_price', coin, price)
+            logger.error("Invalid price for %s: %s", coin, price)
             continue
 
         # Validate % change (optional field)
-        if pct_change is not None and not isinstance(pct_change, (int, float)):
+        if pct_change is not None and type(pct_change) not in _NUMERIC:
             report['status'] = 'FAIL'
-            report['details'].append(f'Invalid 24h % change for {coin}: {pct_change}')
-            logger.error(f"Invalid 24h change for {coin}: {pct_change}")
+            coin_events[index] = ('invalid_change', coin, pct_change)
+            logger.error("Invalid 24h change for %s: %s", coin, pct_change)
             continue
 
         # Add to summary
@@ -268,55 +490,138 @@ def validate_crypto_data(
             '24h_change': pct_change
         }
 
-        change_str = f" (24h change: {pct_change:+.2f}%)" if pct_change is not None else ""
-        report['details'].append(
-            f'✓ {coin}: {price:.2f} {currency.upper()}{change_str}'
-        )
+        if pct_change is None:
+            coin_events[index] = ('valid', coin, price)
+        else:
+            coin_events[index] = ('valid_change', coin, (price, pct_change))
         valid_coins += 1
 
+    report['events'].extend(coin_events)
+
     # Final status
     if report['status'] == 'PASS' and valid_coins == total_coins:
-        report['details'].append(f'✓ All {total_coins} coins validated successfully.')
-        logger.info(f"All {total_coins} coins validated successfully")
+        report['events'].append(('all_valid', None, total_coins))
+        logger.info("All %s coins validated successfully", total_coins)
     else:
         report['status'] = 'FAIL'
-        report['details'].append(f'✗ Only {valid_coins}/{total_coins} coins validated successfully.')
-        logger.error(f"Only {valid_coins}/{total_coins} coins validated successfully")
+        report['events'].append(('partial', None, (valid_coins, total_coins)))
+        logger.error(
+            "Only %s/%s coins validated successfully", valid_coins, total_coins
+        )
 
     return report
 
 
-def save_report(report: Dict[str, Any], config: Config) -> str:
+def _iter_details(report: Dict[str, Any]) -> Iterator[str]:
+    """Yield a report's validation events as human-readable detail lines."""
+    currency = report['currency'].upper()
+    for code, coin, value in report['events']:
+        yield EVENT_TEMPLATES[code].format(coin=coin, value=value, currency=currency)
+
+
+def render_details(report: Dict[str, Any]) -> List[str]:
+    """Format a report's validation events into human-readable detail lines."""
+    return list(_iter_details(report))
+
+
+def render_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the report with 'events' rendered into 'details'."""
+    rendered = {}
+    for key, value in report.items():
+        if key == 'events':
+            rendered['details'] = render_details(report)
+        else:
+            rendered[key] = value
+    return rendered
+
+
+def _dump_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a report to indented JSON, rendering its events if needed."""
+    if 'events' in report:
+        report = render_report(report)
+    return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a raw file descriptor, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def stream_report(write: Callable[[bytes], Any], report: Dict[str, Any]) -> None:
+    """
+    Write a report as JSON, rendering one detail at a time.
+
+    Events are rendered and written individually as newline-separated entries
+    of the 'details' array, so the full list of detail strings is never built.
+
+    Args:
+        write: Callable accepting bytes, e.g. a binary stream's write method
+        report: Validation report dictionary as returned by validate_crypto_data
+    """
+    write(b'{')
+    for position, (key, value) in enumerate(report.items()):
+        if position:
+            write(b',')
+        if key == 'events':
+            write(b'"details":[')
+            for index, detail in enumerate(_iter_details(report)):
+                write((b',\n' if index else b'\n') + orjson.dumps(detail))
+            write(b'\n]')
+        else:
+            write(orjson.dumps(key) + b':' + orjson.dumps(value))
+    write(b'}\n')
+
+
+def save_report(
+        report: Dict[str, Any],
+        config: Config,
+        now: Optional[datetime] = None,
+        stream: bool = False,
+        tag: Optional[str] = None
+) -> str:
     """
     Save validation report to JSON file with PST timestamp.
 
     Args:
-        report: Validation report dictionary
+        report: Validation report dictionary, rendered or not
         config: Configuration object
+        now: Run timestamp in PST (defaults to the current time)
+        stream: Write the report incrementally via stream_report()
+        tag: Filename suffix, e.g. the currency when reports share a timestamp
 
     Returns:
         Path to saved report file
     """
-    timestamp = datetime.now(PST).strftime('%Y%m%d_%H%M%S')
-    filename = f'api_validation_report_{timestamp}.json'
+    timestamp = (now or datetime.now(PST)).strftime(_STRFTIME_FMT)
+    suffix = f'_{tag}' if tag else ''
+    filename = f'api_validation_report_{timestamp}{suffix}.json'
     filepath = os.path.join(config.logs_dir, filename)
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(report, file, indent=4, ensure_ascii=False)
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if stream:
+                stream_report(partial(_write_all, fd), report)
+            else:
+                _write_all(fd, _dump_report(report))
+        finally:
+            os.close(fd)
 
         logger = logging.getLogger(__name__)
-        logger.info(f'Report saved to {filepath}')
+        logger.info('Report saved to %s', filepath)
         return filepath
 
     except Exception as e:
         logger = logging.getLogger(__name__)
-        logger.error(f'Failed to save report: {e}')
+        logger.error('Failed to save report: %s', e)
         raise
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse CLI arguments for flexibility."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description='CoinGecko API Data Validation Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -325,6 +630,10 @@ Examples:
   python main.py
   python main.py --coins bitcoin,ethereum --currency usd
   python main.py --coins solana,dogecoin --currency eur
+  python main.py --coins bitcoin --currency usd,eur,gbp
+  python main.py --strict
+  python main.py --no-cache
+  python main.py --stream
   python main.py --config custom_config.yaml
         """
     )
@@ -338,7 +647,8 @@ Examples:
     parser.add_argument(
         '--currency',
         default='usd',
-        help='Currency for price comparison (default: usd)'
+        help='Comma-separated list of currencies for price comparison, '
+             'fetched concurrently with one report each (default: usd)'
     )
 
     parser.add_argument(
@@ -360,7 +670,33 @@ Examples:
         help='Output format (default: json)'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Also validate the response against a generated JSON schema'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk API response cache'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Write JSON reports incrementally, one detail line at a time'
+    )
+
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for flexibility."""
+    return _PARSER.parse_args()
 
 
 def print_summary(report: Dict[str, Any]) -> None:
@@ -381,11 +717,49 @@ def print_summary(report: Dict[str, Any]) -> None:
             print(f"  {coin}: {data['price']:.2f} {data['currency']}{change_str}")
 
     print(f"\nDetails:")
-    for detail in report['details']:
+    details = _iter_details(report) if 'events' in report else report['details']
+    for detail in details:
         print(f"  {detail}")
     print(f"{'=' * 50}\n")
 
 
+def _print_json_reports(
+        reports: Dict[str, Dict[str, Any]],
+        keyed: bool,
+        stream: bool
+) -> None:
+    """
+    Write reports to stdout as a single JSON document.
+
+    A lone report is written as-is; when keyed, the reports are wrapped in
+    one object keyed by currency so the output stays parseable.
+    """
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    if not keyed:
+        for report in reports.values():
+            if stream:
+                stream_report(write, report)
+            else:
+                write(_dump_report(report) + b'\n')
+        return
+
+    if not stream:
+        rendered = {
+            currency: render_report(report) for currency, report in reports.items()
+        }
+        write(orjson.dumps(rendered, option=orjson.OPT_INDENT_2) + b'\n')
+        return
+
+    write(b'{')
+    for position, (currency, report) in enumerate(reports.items()):
+        if position:
+            write(b',')
+        write(orjson.dumps(currency) + b':')
+        stream_report(write, report)
+    write(b'}\n')
+
+
 def main() -> None:
     """Main workflow for fetching, validating, and saving crypto data."""
     args = parse_args()
@@ -395,7 +769,9 @@ def main() -> None:
 
     # Override config with CLI args if provided
     if args.verbose:
-        config.log_level = "DEBUG"
+        config = replace(config, log_level="DEBUG")
+    if args.no_cache:
+        config = replace(config, cache_expire_after=0)
 
     # Setup logging
     setup_logging(config)
@@ -406,37 +782,55 @@ def main() -> None:
 
         # Parse coins list
         coins_list = [coin.strip() for coin in args.coins.split(',')]
-        logger.info(f"Validating coins: {coins_list}")
-
-        # Fetch data
-        data = fetch_crypto_data(args.coins, args.currency, config)
-
-        # Validate data
-        report = validate_crypto_data(data, coins_list, args.currency)
-
-        # Save report
-        filepath = save_report(report, config)
+        logger.info("Validating coins: %s", coins_list)
+
+        # Fetch data, one concurrent request per currency
+        currencies = [currency.strip() for currency in args.currency.split(',')]
+        results = fetch_crypto_data_many(args.coins, currencies, config)
+        multiple = len(results) > 1
+
+        # Validate and save one report per fetched currency, sharing one
+        # timestamp between the reports and their filenames
+        run_ts = datetime.now(PST)
+        all_passed = True
+        reports = {}
+        for currency, result in results.items():
+            if isinstance(result, APIError):
+                logger.error("API Error: %s", result)
+                all_passed = False
+                continue
+
+            report = validate_crypto_data(
+                result, coins_list, currency, strict=args.strict, now=run_ts
+            )
+            save_report(
+                report, config, now=run_ts, stream=args.stream,
+                tag=currency if multiple else None
+            )
+            reports[currency] = report
+            all_passed = all_passed and report['status'] == 'PASS'
 
         # Output results
         if args.output_format == 'summary':
-            print_summary(report)
+            for report in reports.values():
+                print_summary(report)
         else:
-            print(json.dumps(report, indent=4, ensure_ascii=False))
+            _print_json_reports(reports, keyed=multiple, stream=args.stream)
 
         logger.info('API data validation workflow completed successfully')
 
         # Exit with appropriate code
-        exit_code = 0 if report['status'] == 'PASS' else 1
+        exit_code = 0 if all_passed else 1
         exit(exit_code)
 
     except APIError as e:
-        logger.error(f"API Error: {e}")
+        logger.error("API Error: %s", e)
         exit(1)
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
         exit(130)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         exit(1)
 
 
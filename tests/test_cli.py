@@ -1,5 +1,9 @@
+import json
+
 import pytest
-from main import parse_args
+import requests_mock
+
+from main import main, parse_args
 
 def test_parse_args_defaults(monkeypatch):
     """Test CLI defaults are returned when no args provided."""
@@ -10,6 +14,9 @@ def test_parse_args_defaults(monkeypatch):
     assert args.config == 'config.yaml'  # New default
     assert args.verbose is False  # New default
     assert args.output_format == 'json'  # New default
+    assert args.strict is False
+    assert args.no_cache is False
+    assert args.stream is False
 
 def test_parse_args_custom(monkeypatch):
     """Test CLI returns provided arguments correctly."""
@@ -31,4 +38,39 @@ def test_parse_args_new_options(monkeypatch):
     assert args.coins == 'bitcoin'
     assert args.currency == 'usd'
     assert args.verbose is True
-    assert args.output_format == 'summary'
\ No newline at end of file
+    assert args.output_format == 'summary'
+
+
+def test_main_multiple_currencies(monkeypatch, tmp_path, capsysbinary):
+    """Test several currencies produce one parseable JSON document on stdout."""
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({
+        'logs_dir': str(tmp_path / 'logs'),
+        'cache_name': str(tmp_path / 'cache'),
+        'max_retries': 1,
+    }))
+    monkeypatch.setattr('main.setup_logging', lambda config: None)
+    monkeypatch.setattr('sys.argv', [
+        'main.py',
+        '--coins', 'bitcoin',
+        '--currency', 'usd,gbp',
+        '--config', str(config_path),
+        '--no-cache',
+    ])
+    (tmp_path / 'logs').mkdir()
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=usd',
+            json={'bitcoin': {'usd': 30000}}
+        )
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=gbp',
+            status_code=500
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+    assert exc_info.value.code == 1
+    output = json.loads(capsysbinary.readouterr().out)
+    assert list(output) == ['usd']
+    assert output['usd']['status'] == 'PASS'
+    assert len(list((tmp_path / 'logs').iterdir())) == 1
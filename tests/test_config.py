@@ -0,0 +1,47 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from main import Config, load_config
+
+
+def test_load_config_yaml(tmp_path):
+    """Test YAML configuration files are loaded."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('max_retries: 5\nlogs_dir: "custom_logs"\n')
+    config = load_config(str(path))
+    assert config.max_retries == 5
+    assert config.logs_dir == 'custom_logs'
+
+
+def test_load_config_empty_default_coins(tmp_path):
+    """Test an empty default_coins key keeps the rest of the file."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('max_retries: 5\ndefault_coins:\n')
+    config = load_config(str(path))
+    assert config.max_retries == 5
+    assert config.default_coins == ('bitcoin', 'ethereum')
+
+
+def test_load_config_json(tmp_path):
+    """Test JSON configuration files are loaded and cached until modified."""
+    path = tmp_path / 'config.json'
+    path.write_text('{"max_retries": 4}')
+    config = load_config(str(path))
+    assert config.max_retries == 4
+    assert load_config(str(path)) is config
+
+
+def test_load_config_missing(tmp_path):
+    """Test defaults are used when the configuration file does not exist."""
+    config = load_config(str(tmp_path / 'missing.yaml'))
+    assert config == Config()
+
+
+def test_config_is_frozen_and_hashable():
+    """Test Config instances are immutable and usable as cache keys."""
+    config = Config(default_coins=['bitcoin'])
+    assert config.default_coins == ('bitcoin',)
+    assert hash(config) == hash(Config(default_coins=('bitcoin',)))
+    with pytest.raises(FrozenInstanceError):
+        config.max_retries = 10
@@ -1,11 +1,11 @@
 import requests_mock
 import pytest
-from main import fetch_crypto_data, Config, APIError
+from main import fetch_crypto_data, fetch_crypto_data_many, Config, APIError
 
 
-def test_fetch_crypto_data_success():
+def test_fetch_crypto_data_success(tmp_path):
     """Test that fetch_crypto_data returns correct data when API call succeeds."""
-    config = Config()  # Create config object
+    config = Config(cache_name=str(tmp_path / 'cache'), cache_expire_after=0)
     with requests_mock.Mocker() as m:
         m.get(
             'https://api.coingecko.com/api/v3/simple/price',
@@ -15,13 +15,127 @@ def test_fetch_crypto_data_success():
         assert data == {'bitcoin': {'usd': 30000, 'usd_24h_change': 2.5}}
 
 
-def test_fetch_crypto_data_failure():
+def test_fetch_crypto_data_failure(tmp_path):
     """Test that fetch_crypto_data raises APIError on failure."""
-    config = Config(max_retries=1)  # Use config with 1 retry
+    config = Config(  # Use config with 1 retry
+        max_retries=1, cache_name=str(tmp_path / 'cache'), cache_expire_after=0
+    )
     with requests_mock.Mocker() as m:
         m.get(
             'https://api.coingecko.com/api/v3/simple/price',
             status_code=500
         )
         with pytest.raises(APIError):
-            fetch_crypto_data('bitcoin', 'usd', config)
\ No newline at end of file
+            fetch_crypto_data('bitcoin', 'usd', config)
+
+
+def test_fetch_crypto_data_honors_retry_after(monkeypatch, tmp_path):
+    """Test that a 429 response waits for Retry-After before retrying."""
+    delays = []
+    monkeypatch.setattr('main.sleep', delays.append)
+    config = Config(
+        max_retries=2, cache_name=str(tmp_path / 'cache'), cache_expire_after=0
+    )
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price',
+            [
+                {'status_code': 429, 'headers': {'Retry-After': '7'}},
+                {'json': {'bitcoin': {'usd': 30000}}},
+            ]
+        )
+        data = fetch_crypto_data('bitcoin', 'usd', config)
+    assert data == {'bitcoin': {'usd': 30000}}
+    assert delays == [7]
+
+
+def test_fetch_crypto_data_caps_retry_after(monkeypatch, tmp_path):
+    """Test that an excessive Retry-After is capped at the maximum backoff."""
+    delays = []
+    monkeypatch.setattr('main.sleep', delays.append)
+    config = Config(
+        max_retries=2, cache_name=str(tmp_path / 'cache'), cache_expire_after=0
+    )
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price',
+            [
+                {'status_code': 429, 'headers': {'Retry-After': '86400'}},
+                {'json': {'bitcoin': {'usd': 30000}}},
+            ]
+        )
+        fetch_crypto_data('bitcoin', 'usd', config)
+    assert delays == [30]
+
+
+def test_fetch_crypto_data_cached(tmp_path):
+    """Test that a repeat request is served from the response cache."""
+    config = Config(cache_name=str(tmp_path / 'cache'))
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price',
+            json={'bitcoin': {'usd': 30000}}
+        )
+        first = fetch_crypto_data('bitcoin', 'usd', config)
+        second = fetch_crypto_data('bitcoin', 'usd', config)
+    assert first == second == {'bitcoin': {'usd': 30000}}
+    assert m.call_count == 1
+
+
+def test_fetch_crypto_data_no_cache_bypasses_cache(tmp_path):
+    """Test that disabling the cache reaches the network despite a cached entry."""
+    cache_name = str(tmp_path / 'cache')
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price',
+            json={'bitcoin': {'usd': 30000}}
+        )
+        fetch_crypto_data('bitcoin', 'usd', Config(cache_name=cache_name))
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price',
+            json={'bitcoin': {'usd': 31000}}
+        )
+        data = fetch_crypto_data(
+            'bitcoin', 'usd', Config(cache_name=cache_name, cache_expire_after=0)
+        )
+    assert data == {'bitcoin': {'usd': 31000}}
+    assert m.call_count == 2
+
+
+def test_fetch_crypto_data_many(tmp_path):
+    """Test that each currency is fetched and keyed by currency code."""
+    config = Config(cache_name=str(tmp_path / 'cache'), cache_expire_after=0)
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=usd',
+            json={'bitcoin': {'usd': 30000}}
+        )
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=eur',
+            json={'bitcoin': {'eur': 28000}}
+        )
+        data = fetch_crypto_data_many('bitcoin', ['usd', 'eur'], config)
+    assert data == {
+        'usd': {'bitcoin': {'usd': 30000}},
+        'eur': {'bitcoin': {'eur': 28000}},
+    }
+
+
+def test_fetch_crypto_data_many_partial_failure(tmp_path):
+    """Test that one failing currency does not discard the others."""
+    config = Config(
+        max_retries=1, cache_name=str(tmp_path / 'cache'), cache_expire_after=0
+    )
+    with requests_mock.Mocker() as m:
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=usd',
+            json={'bitcoin': {'usd': 30000}}
+        )
+        m.get(
+            'https://api.coingecko.com/api/v3/simple/price?vs_currencies=gbp',
+            status_code=500
+        )
+        data = fetch_crypto_data_many('bitcoin', ['usd', 'gbp'], config)
+    assert data['usd'] == {'bitcoin': {'usd': 30000}}
+    assert isinstance(data['gbp'], APIError)
+    assert 'gbp' in str(data['gbp'])
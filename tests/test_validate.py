@@ -1,4 +1,11 @@
-from main import validate_crypto_data
+import io
+import json
+from datetime import datetime
+
+from main import (
+    PST, Config, print_summary, render_details, render_report, save_report,
+    stream_report, validate_crypto_data
+)
 
 
 def test_validate_crypto_data_valid():
@@ -8,11 +15,19 @@ def test_validate_crypto_data_valid():
         'ethereum': {'usd': 1500, 'usd_24h_change': -0.5}
     }
     coins_list = ['bitcoin', 'ethereum']
-    report = validate_crypto_data(data, coins_list, 'usd')
+    report = validate_crypto_data(data, coins_list, 'usd', strict=True)
     assert report['status'] == 'PASS'
-    assert any('Schema validation passed.' in detail for detail in report['details'])
+    assert any('Schema validation passed.' in detail for detail in render_details(report))
     # Updated message format
-    assert any('All 2 coins validated successfully.' in detail for detail in report['details'])
+    assert any('All 2 coins validated successfully.' in detail for detail in render_details(report))
+
+
+def test_validate_crypto_data_skips_schema_by_default():
+    """Test schema validation only runs in strict mode."""
+    data = {'bitcoin': {'usd': 20000, 'usd_24h_change': 1.5}}
+    report = validate_crypto_data(data, ['bitcoin'], 'usd')
+    assert report['status'] == 'PASS'
+    assert not any('Schema validation' in detail for detail in render_details(report))
 
 
 def test_validate_crypto_data_invalid():
@@ -25,10 +40,116 @@ def test_validate_crypto_data_invalid():
     assert report['status'] == 'FAIL'
 
 
+def test_validate_crypto_data_boolean_price():
+    """Test validation rejects JSON booleans as prices."""
+    data = {
+        'bitcoin': {'usd': True}
+    }
+    report = validate_crypto_data(data, ['bitcoin'], 'usd')
+    assert report['status'] == 'FAIL'
+
+
+def test_validate_crypto_data_non_object_coin():
+    """Test validation reports coins whose data is not an object."""
+    data = {
+        'bitcoin': None
+    }
+    report = validate_crypto_data(data, ['bitcoin'], 'usd')
+    assert report['status'] == 'FAIL'
+    assert 'Invalid data for bitcoin: None' in render_details(report)
+
+
+def test_validate_crypto_data_non_object_payload():
+    """Test validation reports a response that is not an object."""
+    report = validate_crypto_data(['bitcoin'], ['bitcoin'], 'usd', strict=True)
+    assert report['status'] == 'FAIL'
+    assert (
+        "Invalid response payload, expected an object: ['bitcoin']"
+        in render_details(report)
+    )
+
+
 def test_validate_crypto_data_missing():
     """Test validation fails with missing data."""
     data = None
     coins_list = ['bitcoin']
     report = validate_crypto_data(data, coins_list, 'usd')
     assert report['status'] == 'FAIL'
-    assert any('No data received from API.' in detail for detail in report['details'])
\ No newline at end of file
+    assert any('No data received from API.' in detail for detail in render_details(report))
+
+
+def test_validate_crypto_data_schema_error():
+    """Test schema violations are reported instead of raised."""
+    data = {
+        'bitcoin': {'usd': 'not-a-number'}
+    }
+    coins_list = ['bitcoin']
+    report = validate_crypto_data(data, coins_list, 'usd', strict=True)
+    assert report['status'] == 'FAIL'
+    assert any('Schema validation error' in detail for detail in render_details(report))
+
+
+def test_validate_crypto_data_strict_duplicate_coins():
+    """Test strict mode tolerates a coin listed more than once."""
+    data = {'bitcoin': {'usd': 20000}}
+    report = validate_crypto_data(data, ['bitcoin', 'bitcoin'], 'usd', strict=True)
+    assert report['status'] == 'PASS'
+    assert 'Schema validation passed.' in render_details(report)
+
+
+def test_save_report(tmp_path):
+    """Test the rendered report is written to disk as JSON."""
+    data = {'bitcoin': {'usd': 20000, 'usd_24h_change': 1.5}}
+    now = datetime(2025, 7, 16, 12, 36, 3, tzinfo=PST)
+    report = render_report(validate_crypto_data(data, ['bitcoin'], 'usd', now=now))
+    filepath = save_report(report, Config(logs_dir=str(tmp_path)), now=now)
+    assert report['timestamp'] == '2025-07-16T12:36:03-07:00'
+    assert filepath.endswith('api_validation_report_20250716_123603.json')
+    with open(filepath, encoding='utf-8') as file:
+        assert json.load(file) == report
+
+
+def test_save_report_stream(tmp_path):
+    """Test a streamed report matches the rendered report once parsed."""
+    data = {
+        'bitcoin': {'usd': 20000, 'usd_24h_change': 1.5},
+        'ethereum': {'usd': 1500}
+    }
+    report = validate_crypto_data(data, ['bitcoin', 'ethereum', 'solana'], 'usd')
+    filepath = save_report(report, Config(logs_dir=str(tmp_path)), stream=True)
+    with open(filepath, encoding='utf-8') as file:
+        assert json.load(file) == render_report(report)
+
+
+def test_save_report_tag(tmp_path):
+    """Test a tag is appended to the report filename."""
+    data = {'bitcoin': {'eur': 18000}}
+    now = datetime(2025, 7, 16, 12, 36, 3, tzinfo=PST)
+    report = render_report(validate_crypto_data(data, ['bitcoin'], 'eur', now=now))
+    filepath = save_report(report, Config(logs_dir=str(tmp_path)), now=now, tag='eur')
+    assert filepath.endswith('api_validation_report_20250716_123603_eur.json')
+
+
+def test_stream_report_to_buffer():
+    """Test a report can be streamed to a stream without a file descriptor."""
+    data = {'bitcoin': {'usd': 20000}}
+    report = validate_crypto_data(data, ['bitcoin'], 'usd')
+    buffer = io.BytesIO()
+    stream_report(buffer.write, report)
+    assert json.loads(buffer.getvalue()) == render_report(report)
+
+
+def test_save_report_unrendered(tmp_path):
+    """Test an unrendered report is saved with rendered details."""
+    data = {'bitcoin': {'usd': 20000}}
+    report = validate_crypto_data(data, ['bitcoin'], 'usd')
+    filepath = save_report(report, Config(logs_dir=str(tmp_path)))
+    with open(filepath, encoding='utf-8') as file:
+        assert json.load(file) == render_report(report)
+
+
+def test_print_summary_unrendered(capsys):
+    """Test the summary renders validation events itself."""
+    data = {'bitcoin': {'usd': 20000}}
+    print_summary(validate_crypto_data(data, ['bitcoin'], 'usd'))
+    assert '✓ bitcoin: 20000.00 USD' in capsys.readouterr().out